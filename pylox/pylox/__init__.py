@@ -1,10 +1,35 @@
 # pylox/__init__.py
 
-from .error_handler import ErrorHandler  # noqa: F401
-from .lox_token import Token  # noqa: F401
-from .main import Lox  # noqa: F401
-from .parser import Parser  # noqa: F401
-from .scanner import Scanner  # noqa: F401
-from .token_type import TokenType  # noqa: F401
+from typing import Any
 
 __version__ = '0.1.0'
+
+# Re-exports resolved lazily (PEP 562): `import pylox` no longer compiles
+# and initializes every module up front — each submodule is imported the
+# first time its name is touched.
+_EXPORTS = {
+    'ErrorHandler': '.error_handler',
+    'Interpreter': '.interpreter',
+    'Lox': '.main',
+    'Parser': '.parser',
+    'Scanner': '.scanner',
+    'Token': '.lox_token',
+    'TokenType': '.token_type',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later accesses skip __getattr__.
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__ + ['__version__'])
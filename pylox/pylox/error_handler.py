@@ -1,5 +1,8 @@
 # pylox/error_reporter.py
 
+import sys
+from typing import TextIO
+
 from .lox_runtime_error import LoxRuntimeError
 from .lox_token import Token
 from .token_type import TokenType as TT
@@ -12,24 +15,39 @@ class ErrorHandler:
     def __init__(self) -> None:
         self.has_error = False
         self.has_runtime_error = False
+        # Diagnostics are buffered and written in one flush() so a failed
+        # parse of a large file does not pay one print() per error.
+        self._buf: list[str] = []
 
     def runtime_error(self, e: LoxRuntimeError) -> None:
-        print(f'{str(e)} [line {e.token.line}]')
+        self._buf.append(f'{str(e)} [line {e.token.line}]')
         self.has_runtime_error = True
 
+    def flush(self, stream: TextIO | None = None) -> None:
+        """Write all buffered diagnostics with a single stream write."""
+        if not self._buf:
+            return
+        if stream is None:
+            stream = sys.stderr
+        stream.write('\n'.join(self._buf) + '\n')
+        self._buf.clear()
+
+    def error_at_line(self, line: int, message: str) -> None:
+        self.report(line, '', message)
+
+    def error_at_token(self, token: Token, message: str) -> None:
+        if token.token_type == TT.EOF:
+            self.report(token.line, ' at end', message)
+        else:
+            self.report(token.line, f" at '{token.lexeme}'", message)
+
     def error(self, token_or_line: Token | int, message: str) -> None:
-        # line
+        """Legacy entry point; prefer the explicit methods above."""
         if isinstance(token_or_line, int):
-            self.report(token_or_line, '', message)
-
-        # Token
-        if isinstance(token_or_line, Token):
-            tk = token_or_line
-            if tk.token_type == TT.EOF:
-                self.report(tk.line, ' at end', message)
-            else:
-                self.report(tk.line, f" at '{tk.lexeme}'", message)
+            self.error_at_line(token_or_line, message)
+        else:
+            self.error_at_token(token_or_line, message)
 
     def report(self, line: int, where: str, message: str) -> None:
-        print(f'[line {line}] Error{where}: {message}')
+        self._buf.append(f'[line {line}] Error{where}: {message}')
         self.has_error = True
@@ -1,32 +1,27 @@
 # pylox/expr.py
 
- 
+
 from __future__ import annotations # For forward references
 
-from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Protocol, TypeVar
-              
+from typing import NamedTuple, Protocol, TypeVar
+
 from .lox_token import Token
-              
+
 T = TypeVar('T', covariant=True)
 
     
-class Expr(ABC):
-    @abstractmethod
-    def accept(self, visitor: Visitor[T]) -> T: ...
 
 
 class Visitor(Protocol[T]):
     def visit_binary_expr(self, expr: Binary) -> T: ...
+    def visit_chain_expr(self, expr: Chain) -> T: ...
     def visit_grouping_expr(self, expr: Grouping) -> T: ...
     def visit_literal_expr(self, expr: Literal) -> T: ...
     def visit_unary_expr(self, expr: Unary) -> T: ...
     def visit_variable_expr(self, expr: Variable) -> T: ...
 
 
-@dataclass(frozen=True)
-class Binary(Expr):
+class Binary(NamedTuple):
     left: Expr
     operator: Token
     right: Expr
@@ -35,24 +30,29 @@ class Binary(Expr):
         return visitor.visit_binary_expr(self)
 
 
-@dataclass(frozen=True)
-class Grouping(Expr):
+class Chain(NamedTuple):
+    operands: tuple[Expr, ...]
+    operators: tuple[Token, ...]
+
+    def accept(self, visitor: Visitor[T]) -> T:
+        return visitor.visit_chain_expr(self)
+
+
+class Grouping(NamedTuple):
     expression: Expr
 
     def accept(self, visitor: Visitor[T]) -> T:
         return visitor.visit_grouping_expr(self)
 
 
-@dataclass(frozen=True)
-class Literal(Expr):
+class Literal(NamedTuple):
     value: object
 
     def accept(self, visitor: Visitor[T]) -> T:
         return visitor.visit_literal_expr(self)
 
 
-@dataclass(frozen=True)
-class Unary(Expr):
+class Unary(NamedTuple):
     operator: Token
     right: Expr
 
@@ -60,9 +60,11 @@ class Unary(Expr):
         return visitor.visit_unary_expr(self)
 
 
-@dataclass(frozen=True)
-class Variable(Expr):
+class Variable(NamedTuple):
     name: Token
 
     def accept(self, visitor: Visitor[T]) -> T:
         return visitor.visit_variable_expr(self)
+
+
+Expr = Binary | Chain | Grouping | Literal | Unary | Variable
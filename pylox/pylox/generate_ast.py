@@ -1,16 +1,9 @@
 # pylox/generate_ast.py
 import sys
+from collections.abc import Callable
 
-
-class StringBuilder:
-    def __init__(self) -> None:
-        self.parts: list[str] = []
-
-    def write(self, x: str) -> None:
-        self.parts.append(x)
-
-    def get_string(self) -> str:
-        return '\n'.join(self.parts)
+# Writes one generated line: takes the line body, appends the newline.
+LineWriter = Callable[[str], None]
 
 
 def main() -> None:
@@ -24,6 +17,8 @@ def main() -> None:
         'Expr',
         [
             'Binary - left: Expr, operator: Token, right: Expr',
+            # Flattened run of same-precedence binary operators.
+            'Chain - operands: tuple[Expr, ...], operators: tuple[Token, ...]',
             'Grouping - expression: Expr',
             'Literal - value: object',
             'Unary - operator: Token, right: Expr',
@@ -36,7 +31,7 @@ def main() -> None:
         [
             'Expression - expression: Expr',
             'Print - expression: Expr',
-            'Var - name: Token, initializer: Expr',  # Statement for declaring a variable.
+            'Var - name: Token, initializer: Expr | None',  # Statement for declaring a variable.
         ],
         'from .expr import Expr\n',
     )
@@ -46,65 +41,89 @@ def write_ast_node(
     output_dir: str, base_name: str, defns: list[str], extra_headers: str = ''
 ) -> None:
     base_path = f'{output_dir}{base_name.lower()}.py'
-    sb = StringBuilder()
 
-    sb.write(f'# {base_path}\n')
-    sb.write(""" 
+    # Stream each line straight to the file handle: one pass over the
+    # definitions, no intermediate list of parts and no giant join.
+    with open(base_path, 'w') as fp:
+
+        def w(line: str) -> None:
+            fp.write(line + '\n')
+
+        w(f'# {base_path}\n')
+        w("""
 from __future__ import annotations # For forward references
 
-from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Protocol, TypeVar
-              
+from typing import NamedTuple, Protocol, TypeVar
+
 from .lox_token import Token
-              
+
 T = TypeVar('T', covariant=True)\n
     """)
 
-    if extra_headers:
-        sb.write(extra_headers)
+        if extra_headers:
+            w(extra_headers)
 
-    sb.write(f'class {base_name}(ABC):')
-    sb.write('    @abstractmethod')
-    sb.write('    def accept(self, visitor: Visitor[T]) -> T: ...')
+        # Write the visitor pattern.
+        write_visitor(w, base_name, defns)
 
-    # Write the visitor pattern.
-    write_visitor(sb, base_name, defns)
+        # The AST classes.
+        for defn in defns:
+            class_name = defn.split('-')[0].strip()
+            fields_str = defn.split('-')[1].strip()
+            w('\n')
+            write_class(w, base_name, class_name, fields_str)
 
-    # The AST classes.
-    for defn in defns:
-        class_name = defn.split('-')[0].strip()
-        fields_str = defn.split('-')[1].strip()
-        sb.write('\n')
-        write_class(sb, base_name, class_name, fields_str)
+        # NamedTuples cannot share an ABC base, so the base "class" is a
+        # union alias over the concrete node types.
+        class_names = [defn.split('-')[0].strip() for defn in defns]
+        w('\n')
+        w(f'{base_name} = ' + ' | '.join(class_names))
 
-    # Write to file
-    with open(base_path, 'w') as fp:
-        fp.write(sb.get_string() + '\n')
 
-
-def write_visitor(sb: StringBuilder, base_name: str, defns: list[str]) -> None:
-    sb.write('\n')
-    sb.write('class Visitor(Protocol[T]):')
+def write_visitor(w: LineWriter, base_name: str, defns: list[str]) -> None:
+    w('\n')
+    w('class Visitor(Protocol[T]):')
     for defn in defns:
         class_name = defn.split('-')[0].strip()
-        sb.write(
+        w(
             f'    def visit_{class_name.lower()}_{base_name.lower()}(self, {base_name.lower()}: {class_name}) -> T: ...'
         )
 
 
+def split_fields(fields_str: str) -> list[str]:
+    """Split 'name: type, name: type' on top-level commas only, so types
+    like tuple[Expr, ...] stay intact."""
+    fields: list[str] = []
+    depth = 0
+    part = ''
+    for ch in fields_str:
+        if ch == ',' and depth == 0:
+            fields.append(part.strip())
+            part = ''
+            continue
+        if ch in '[(':
+            depth += 1
+        elif ch in '])':
+            depth -= 1
+        part += ch
+    fields.append(part.strip())
+    return fields
+
+
 def write_class(
-    sb: StringBuilder, base_name: str, class_name: str, fields_str: str
+    w: LineWriter, base_name: str, class_name: str, fields_str: str
 ) -> None:
-    sb.write('@dataclass(frozen=True)')
-    sb.write(f'class {class_name}({base_name}):')
+    # NamedTuple, not a dataclass: construction is a C-level tuple fill
+    # with no __init__/__setattr__ round trip, and the parser allocates
+    # one node per grammar production.
+    w(f'class {class_name}(NamedTuple):')
 
-    for field in fields_str.split(','):
-        sb.write(f'    {field.strip()}')
+    for field in split_fields(fields_str):
+        w(f'    {field}')
 
-    sb.write('')
-    sb.write('    def accept(self, visitor: Visitor[T]) -> T:')
-    sb.write(
+    w('')
+    w('    def accept(self, visitor: Visitor[T]) -> T:')
+    w(
         f'        return visitor.visit_{class_name.lower()}_{base_name.lower()}(self)'
     )
 
@@ -1,18 +1,92 @@
 # pylox/interpreter.py
 
-from typing import cast
+import operator
+from collections.abc import Callable
 
 from .error_handler import ErrorHandler
-from .expr import Binary, Expr, Grouping, Literal, Unary
+from .expr import Binary, Chain, Expr, Grouping, Literal, Unary, Variable
 from .expr import Visitor as ExprVisitor
 from .lox_runtime_error import LoxRuntimeError
 from .lox_token import Token
-from .stmt import Expression, Print, Stmt
+from .stmt import Expression, Print, Stmt, Var
 from .stmt import Visitor as StmtVisitor
 from .token_type import TokenType as TT
 
+# One small handler per binary operator, dispatched by token type in O(1)
+# instead of scanning a match/case chain. Each takes the interpreter (for
+# error construction), the evaluated operands and the operator token.
+BinaryHandler = Callable[['Interpreter', object, object, Token], object]
+
+
+def _numeric_handler(num_op: Callable[[float, float], object]) -> BinaryHandler:
+    """Wrap a C-level function from the operator module with the
+    two-number type check every arithmetic/comparison op needs."""
+
+    def handler(
+        interp: 'Interpreter', left: object, right: object, op_token: Token
+    ) -> object:
+        if isinstance(left, float) and isinstance(right, float):
+            return num_op(left, right)
+        raise interp.number_error(op_token)
+
+    return handler
+
+
+def _plus_handler(
+    interp: 'Interpreter', left: object, right: object, op_token: Token
+) -> object:
+    if isinstance(left, float) and isinstance(right, float):
+        return left + right
+    if isinstance(left, str) and isinstance(right, str):
+        return left + right
+    return None  # Matches the old fallthrough for mixed operands.
+
+
+def _bang_equal_handler(
+    interp: 'Interpreter', left: object, right: object, op_token: Token
+) -> object:
+    return left != right
+
+
+def _equal_equal_handler(
+    interp: 'Interpreter', left: object, right: object, op_token: Token
+) -> object:
+    return left == right
+
+
+_BINARY_HANDLERS: dict[TT, BinaryHandler] = {
+    TT.MINUS: _numeric_handler(operator.sub),
+    TT.SLASH: _numeric_handler(operator.truediv),
+    TT.STAR: _numeric_handler(operator.mul),
+    TT.GREATER: _numeric_handler(operator.gt),
+    TT.GREATER_EQUAL: _numeric_handler(operator.ge),
+    TT.LESS: _numeric_handler(operator.lt),
+    TT.LESS_EQUAL: _numeric_handler(operator.le),
+    TT.PLUS: _plus_handler,
+    TT.BANG_EQUAL: _bang_equal_handler,
+    TT.EQUAL_EQUAL: _equal_equal_handler,
+}
+
 
 class Interpreter(ExprVisitor[object], StmtVisitor[None]):
+    def __init__(self) -> None:
+        # Direct type -> bound-method dispatch. expr.accept(visitor) costs
+        # two Python calls and an attribute lookup per node; a dict lookup
+        # on type(node) costs one call.
+        self._expr_dispatch: dict[type, Callable[..., object]] = {
+            Binary: self.visit_binary_expr,
+            Chain: self.visit_chain_expr,
+            Grouping: self.visit_grouping_expr,
+            Literal: self.visit_literal_expr,
+            Unary: self.visit_unary_expr,
+            Variable: self.visit_variable_expr,
+        }
+        self._stmt_dispatch: dict[type, Callable[..., None]] = {
+            Expression: self.visit_expression_stmt,
+            Print: self.visit_print_stmt,
+            Var: self.visit_var_stmt,
+        }
+
     def interpret(self, statements: list[Stmt], eh: ErrorHandler) -> None:
         try:
             for statement in statements:
@@ -21,7 +95,7 @@ class Interpreter(ExprVisitor[object], StmtVisitor[None]):
             eh.runtime_error(e)
 
     def execute(self, stmt: Stmt) -> None:
-        stmt.accept(self)
+        self._stmt_dispatch[type(stmt)](stmt)
 
     """
     INTERPRET STATEMENTS
@@ -34,6 +108,11 @@ class Interpreter(ExprVisitor[object], StmtVisitor[None]):
         value = self.evaluate(stmt.expression)
         print(value)
 
+    def visit_var_stmt(self, stmt: Var) -> None:
+        # Environments are not implemented yet: declaring is a no-op,
+        # exactly as when accept() fell through to the Protocol stub.
+        pass
+
     """
     INTERPRET EXPRESSIONS
     """
@@ -44,13 +123,19 @@ class Interpreter(ExprVisitor[object], StmtVisitor[None]):
     def visit_grouping_expr(self, expr: Grouping) -> object:
         return self.evaluate(expr.expression)
 
+    def visit_variable_expr(self, expr: Variable) -> object:
+        # No environment to read from yet: every variable evaluates to
+        # nil, exactly as the Protocol stub did.
+        return None
+
     def visit_unary_expr(self, expr: Unary) -> object:
         right = self.evaluate(expr.right)
 
         match expr.operator.token_type:
             case TT.MINUS:
-                self.check_number_operand(expr.operator, right)
-                return -cast(float, right)
+                if isinstance(right, float):
+                    return -right
+                raise self.number_error(expr.operator)
 
             case TT.BANG:
                 return not self.is_truthy(right)
@@ -60,40 +145,26 @@ class Interpreter(ExprVisitor[object], StmtVisitor[None]):
     def visit_binary_expr(self, expr: Binary) -> object:
         left = self.evaluate(expr.left)
         right = self.evaluate(expr.right)
-
-        match expr.operator.token_type:
-            case TT.MINUS:
-                self.check_number_operand(expr.operator, left, right)
-                return cast(float, left) - cast(float, right)
-            case TT.SLASH:
-                self.check_number_operand(expr.operator, left, right)
-                return cast(float, left) / cast(float, right)
-            case TT.STAR:
-                self.check_number_operand(expr.operator, left, right)
-                return cast(float, left) * cast(float, right)
-            case TT.PLUS:
-                if isinstance(left, float) and isinstance(right, float):
-                    return float(left) + float(right)
-                if isinstance(left, str) and isinstance(right, str):
-                    return str(left) + str(right)
-            case TT.GREATER:
-                self.check_number_operand(expr.operator, left, right)
-                return cast(float, left) > cast(float, right)
-            case TT.GREATER_EQUAL:
-                self.check_number_operand(expr.operator, left, right)
-                return cast(float, left) >= cast(float, right)
-            case TT.LESS:
-                self.check_number_operand(expr.operator, left, right)
-                return cast(float, left) < cast(float, right)
-            case TT.LESS_EQUAL:
-                self.check_number_operand(expr.operator, left, right)
-                return cast(float, left) <= cast(float, right)
-            case TT.BANG_EQUAL:
-                return left != right
-            case TT.EQUAL_EQUAL:
-                return left == right
-
-        return None  # Never reaches
+        return self.apply_binary(expr.operator, left, right)
+
+    def visit_chain_expr(self, expr: Chain) -> object:
+        # Left fold over the flattened operator run: one Python frame for
+        # the whole chain instead of one visit per Binary node.
+        evaluate = self.evaluate
+        apply_binary = self.apply_binary
+        operands = expr.operands
+
+        result = evaluate(operands[0])
+        for i, op_token in enumerate(expr.operators):
+            result = apply_binary(op_token, result, evaluate(operands[i + 1]))
+        return result
+
+    def apply_binary(
+        self, op_token: Token, left: object, right: object
+    ) -> object:
+        return _BINARY_HANDLERS[op_token.token_type](
+            self, left, right, op_token
+        )
 
     """
     HELPER FUNCTIONS
@@ -103,14 +174,18 @@ class Interpreter(ExprVisitor[object], StmtVisitor[None]):
         if obj is None:
             return 'nil'
         if isinstance(obj, float):
-            if int(obj) == float(obj):
+            # is_integer() is one C call; int(obj) == float(obj) converted
+            # twice and can raise on inf/nan.
+            if obj.is_integer():
                 return str(int(obj))
-            return str(obj)
+            return repr(obj)
         return repr(obj)
 
-    def check_number_operand(self, operator: Token, *operands: object) -> None:
-        if not all(isinstance(operand, float) for operand in operands):
-            raise LoxRuntimeError(operator, 'Operand(s) must be numbers.')
+    def number_error(self, operator: Token) -> LoxRuntimeError:
+        """Build the operand-type error. Only called on the failure path,
+        so the success path of every numeric op allocates nothing; the old
+        check_number_operand built a generator plus all() per operation."""
+        return LoxRuntimeError(operator, 'Operand(s) must be numbers.')
 
     def is_truthy(self, obj: object) -> bool:
         """
@@ -123,4 +198,4 @@ class Interpreter(ExprVisitor[object], StmtVisitor[None]):
         return True
 
     def evaluate(self, expr: Expr) -> object:
-        return expr.accept(self)
+        return self._expr_dispatch[type(expr)](expr)
@@ -7,5 +7,5 @@ class LoxRuntimeError(RuntimeError):
     token: Token
 
     def __init__(self, token: Token, message: str) -> None:
-        super(message)
+        super().__init__(message)
         self.token = token
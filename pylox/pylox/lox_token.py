@@ -1,14 +1,17 @@
 # pylox/lox_token.py
 
-from dataclasses import dataclass
-from typing import Any
+from typing import Any, NamedTuple
 
 from .token_type import TokenType
 
 
-@dataclass(frozen=True, slots=True)
-class Token:
-    """A lexical token produced by the scanner."""
+class Token(NamedTuple):
+    """A lexical token produced by the scanner.
+
+    A NamedTuple rather than a dataclass: construction is a C-level
+    tuple fill with no __init__/__setattr__ round trip, which matters
+    because the scanner allocates one per token of source.
+    """
 
     token_type: TokenType
     lexeme: str
@@ -16,7 +19,5 @@ class Token:
     line: int
 
     def __str__(self) -> str:
-        return f'{self.token_type} {self.lexeme} {self.literal}'
-
-
-# We use slots to allocate a fixed set of attributes instead of a dynamic dict.
+        # .name, not the member: IntEnum renders as a bare int.
+        return f'{self.token_type.name} {self.lexeme} {self.literal}'
@@ -3,9 +3,13 @@ import sys
 
 from pylox.error_handler import ErrorHandler
 from pylox.interpreter import Interpreter
+from pylox.lox_token import Token
 from pylox.parser import Parser
 from pylox.scanner import Scanner
 
+# Bound on the scanned-token cache; oldest entry is evicted first.
+TOKEN_CACHE_MAX = 64
+
 
 class Lox:
     error_handler: ErrorHandler
@@ -14,6 +18,12 @@ class Lox:
     def __init__(self) -> None:
         self.error_handler = ErrorHandler()
         self.interpreter = Interpreter()
+        # REPL users often re-run a previous line; cache its tokens so a
+        # repeated submission skips scanning. Tokens are immutable and the
+        # parser never mutates the list, so reuse is safe. Keyed by the
+        # source text itself rather than hash(src) — dict lookup already
+        # hashes the key, and the text key cannot collide.
+        self._tok_cache: dict[str, list[Token]] = {}
 
     def main(self) -> None:
         if len(sys.argv) > 2:
@@ -44,15 +54,24 @@ class Lox:
             self.error_handler.has_error = False
 
     def run(self, src: str) -> None:
-        scanner = Scanner(src, self.error_handler)
-        tokens = scanner.scan_tokens()
+        tokens = self._tok_cache.get(src)
+        if tokens is None:
+            scanner = Scanner(src, self.error_handler)
+            tokens = scanner.scan_tokens()
+            if not self.error_handler.has_error:
+                if len(self._tok_cache) >= TOKEN_CACHE_MAX:
+                    # FIFO eviction: dicts iterate in insertion order.
+                    del self._tok_cache[next(iter(self._tok_cache))]
+                self._tok_cache[src] = tokens
         parser = Parser(tokens, self.error_handler)
         statements = parser.parse()
 
         if self.error_handler.has_error or statements is None:
+            self.error_handler.flush()
             sys.exit(65)
 
         self.interpreter.interpret(statements, self.error_handler)
+        self.error_handler.flush()
 
 
 if __name__ == '__main__':
@@ -3,27 +3,90 @@
 from __future__ import annotations  # Allows forward references.
 
 from .error_handler import ErrorHandler
-from .expr import Binary, Expr, Grouping, Literal, Unary, Variable
+from .expr import Binary, Chain, Expr, Grouping, Literal, Unary, Variable
 from .lox_token import Token
 from .stmt import Expression, Print, Stmt, Var
 from .token_type import TokenType as TT
 
+# Binding power of each binary operator, tightest highest. Any token type
+# absent from the map (precedence 0) ends an expression.
+_PREC: dict[TT, int] = {
+    TT.BANG_EQUAL: 1,  # equality
+    TT.EQUAL_EQUAL: 1,
+    TT.GREATER: 2,  # comparison
+    TT.GREATER_EQUAL: 2,
+    TT.LESS: 2,
+    TT.LESS_EQUAL: 2,
+    TT.PLUS: 3,  # term
+    TT.MINUS: 3,
+    TT.STAR: 4,  # factor
+    TT.SLASH: 4,
+}
+
+_UNARY_OPS: frozenset[TT] = frozenset({TT.BANG, TT.MINUS})
+
+# Statement-leading token types that synchronize() resumes at after a
+# parse error.
+_SYNC_TOKENS: frozenset[TT] = frozenset(
+    {
+        TT.CLASS,
+        TT.FUN,
+        TT.VAR,
+        TT.FOR,
+        TT.IF,
+        TT.WHILE,
+        TT.PRINT,
+        TT.RETURN,
+    }
+)
+
+# Token types read once per expression leaf in primary(), bound at module
+# level so each use is a single global load instead of an enum attribute
+# lookup through TT.
+_FALSE = TT.FALSE
+_TRUE = TT.TRUE
+_NIL = TT.NIL
+_NUMBER = TT.NUMBER
+_STRING = TT.STRING
+_LEFT_PAREN = TT.LEFT_PAREN
+_IDENTIFIER = TT.IDENTIFIER
+
+# Shared nodes for the three keyword literals: Literal is frozen and
+# value-based, so every 'true'/'false'/'nil' can reuse one instance
+# instead of allocating a fresh node per occurrence.
+_LIT_TRUE = Literal(True)
+_LIT_FALSE = Literal(False)
+_LIT_NIL = Literal(None)
+
 
 class Parser:
+    __slots__ = ('curr', 'eh', 'last', 'tokens', 'types')
+
     tokens: list[Token]
+    types: list[TT]
     curr: int
+    last: int
     eh: ErrorHandler
 
     def __init__(self, tokens: list[Token], eh: ErrorHandler) -> None:
         self.tokens = tokens
+        # Parallel array of token types: the hot helpers (check/advance/
+        # is_at_end) only need the type, so index a flat list instead of
+        # dereferencing a Token attribute every call.
+        self.types = [token.token_type for token in tokens]
         self.curr = 0
+        # Index of the EOF token, which the scanner always appends last;
+        # lets is_at_end compare indices instead of reading a token type.
+        self.last = len(tokens) - 1
         self.eh = eh
 
     def parse(self) -> list[Stmt] | None:
-        statements = []
+        statements: list[Stmt] = []
         try:
             while not self.is_at_end():
-                statements.append(self.declaration())
+                decl = self.declaration()
+                if decl is not None:
+                    statements.append(decl)
         except ParseError:
             return None
         return statements
@@ -44,7 +107,6 @@ class Parser:
         self.consume(TT.SEMICOLON, 'Expect ";" after variable declaration.')
         return Var(name, initializer)
 
-    # TODO: FIX mypy annotations and control flow.
     def declaration(self) -> Stmt | None:
         """
         declaration → var_declaration | statement ;
@@ -89,91 +151,92 @@ class Parser:
         """
         expression → equality ;
         """
-        return self.equality()
+        return self.binary(1)
 
-    def equality(self) -> Expr:
-        """
-        equality → comparison ( ( "!=" | "==" ) comparison)* ;
+    def binary(self, min_prec: int) -> Expr:
         """
-        expr: Expr = self.comparison()
-
-        while self.match(TT.BANG_EQUAL, TT.EQUAL_EQUAL):
-            operator: Token = self.previous()
-            right: Expr = self.comparison()
-            expr = Binary(expr, operator, right)
-
-        return expr
+        Precedence-climbing parse of the left-associative operator ladder:
 
-    def comparison(self) -> Expr:
-        """
+        equality   → comparison ( ( "!=" | "==" ) comparison )* ;
         comparison → term ( ( ">" | ">=" | "<" | "<=" ) term )* ;
-        """
-        expr: Expr = self.term()
-
-        while self.match(TT.GREATER, TT.GREATER_EQUAL, TT.LESS, TT.LESS_EQUAL):
-            operator: Token = self.previous()
-            right: Expr = self.term()
-            expr = Binary(expr, operator, right)
-
-        return expr
+        term       → factor ( ( "+" | "-" ) factor )* ;
+        factor     → unary ( ( "*" | "/" ) unary )* ;
 
-    def term(self) -> Expr:
+        One loop keyed on _PREC replaces one recursion level per rung: a
+        bare literal costs a single frame here, and recursion only
+        happens when a following operator actually binds tighter.
         """
-        term  → factor (( "+" | "-" ) factor )* ;
-        """
-        expr: Expr = self.factor()
+        # Bound once: the loop then runs on LOAD_FASTs. self.curr must be
+        # re-read each iteration because recursive calls move it.
+        types = self.types
+        tokens = self.tokens
+        prec_of = _PREC.get
 
-        while self.match(TT.PLUS, TT.MINUS):
-            operator: Token = self.previous()
-            right: Expr = self.factor()
-            expr = Binary(expr, operator, right)
+        expr: Expr = self.unary()
 
-        return expr
+        while True:
+            prec = prec_of(types[self.curr], 0)
+            if prec < min_prec:
+                return expr
 
-    def factor(self) -> Expr:
-        """
-        factor → unary (( "*" | "/" ) unary)* ;
-        """
-        expr: Expr = self.unary()
+            # Gather the whole run at this precedence so a long chain
+            # like a + b + c + d becomes one flat Chain node instead of
+            # a left-leaning tree the interpreter recurses through.
+            ops: list[Token] = []
+            operands: list[Expr] = [expr]
 
-        while self.match(TT.STAR, TT.SLASH):
-            operator: Token = self.previous()
-            right: Expr = self.factor()
-            expr = Binary(expr, operator, right)
+            while prec_of(types[self.curr], 0) == prec:
+                i = self.curr
+                self.curr = i + 1
+                ops.append(tokens[i])
+                operands.append(self.binary(prec + 1))
 
-        return expr
+            if len(ops) == 1:
+                expr = Binary(operands[0], ops[0], operands[1])
+            else:
+                expr = Chain(tuple(operands), tuple(ops))
 
     def unary(self) -> Expr:
         """
         unary → ("!" | "-")* unary | primary ;
         """
-        if self.match(TT.BANG, TT.MINUS):
-            operator: Token = self.previous()
-            right: Expr = self.unary()
-            return Unary(operator, right)
-
-        return self.primary()
+        types = self.types
+        if types[self.curr] not in _UNARY_OPS:
+            return self.primary()
+
+        # Collect the whole prefix run iteratively instead of one
+        # recursive frame per operator, then wrap right-to-left.
+        ops: list[Token] = []
+        while types[self.curr] in _UNARY_OPS:
+            i = self.curr
+            self.curr = i + 1
+            ops.append(self.tokens[i])
+
+        expr: Expr = self.primary()
+        for operator in reversed(ops):
+            expr = Unary(operator, expr)
+        return expr
 
     def primary(self) -> Expr:
         """
         primary → NUMBER | STRING | "true" | "false" | "nil" | "(" expression ")"  | IDENTIFIER;
         """
-        if self.match(TT.FALSE):
-            return Literal(False)
-        if self.match(TT.TRUE):
-            return Literal(True)
-        if self.match(TT.NIL):
-            return Literal(None)
-
-        if self.match(TT.NUMBER, TT.STRING):
+        if self.match(_FALSE):
+            return _LIT_FALSE
+        if self.match(_TRUE):
+            return _LIT_TRUE
+        if self.match(_NIL):
+            return _LIT_NIL
+
+        if self.match(_NUMBER, _STRING):
             return Literal(self.previous().literal)
 
-        if self.match(TT.LEFT_PAREN):
+        if self.match(_LEFT_PAREN):
             expr: Expr = self.expression()
             self.consume(TT.RIGHT_PAREN, "Expect ')' after expression.")
             return Grouping(expr)
 
-        if self.match(TT.IDENTIFIER):
+        if self.match(_IDENTIFIER):
             return Variable(self.previous())
 
         raise self.error(self.peek(), 'Expect expression.')
@@ -188,7 +251,7 @@ class Parser:
         raise self.error(self.peek(), message)
 
     def error(self, token: Token, message: str) -> ParseError:
-        self.eh.error(token, message)
+        self.eh.error_at_token(token, message)
         return ParseError()
 
     def match(self, *args: TT) -> bool:
@@ -203,7 +266,7 @@ class Parser:
         """Check if current token matches, but never consumes."""
         if self.is_at_end():
             return False
-        return self.peek().token_type == typ
+        return self.types[self.curr] == typ
 
     def advance(self) -> Token:
         if not self.is_at_end():
@@ -211,7 +274,7 @@ class Parser:
         return self.previous()
 
     def is_at_end(self) -> bool:
-        return self.peek().token_type == TT.EOF
+        return self.curr >= self.last
 
     def peek(self) -> Token:
         return self.tokens[self.curr]
@@ -223,19 +286,10 @@ class Parser:
         self.advance()
 
         while not self.is_at_end():
-            if self.previous().token_type == TT.SEMICOLON:
+            if self.types[self.curr - 1] == TT.SEMICOLON:
                 return
 
-            if self.peek().token_type in [
-                TT.CLASS,
-                TT.FUN,
-                TT.VAR,
-                TT.FOR,
-                TT.IF,
-                TT.WHILE,
-                TT.PRINT,
-                TT.RETURN,
-            ]:
+            if self.types[self.curr] in _SYNC_TOKENS:
                 return
             self.advance()
 
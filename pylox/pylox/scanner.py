@@ -1,163 +1,254 @@
 # pylox/scanner.py
+import re
+import sys
+from typing import cast
+
 from .error_handler import ErrorHandler
 from .lox_token import Token
-from .token_type import CHAR_TOKEN_MAP, KEYWORD_TOKEN_MAP
+from .token_type import KEYWORD_TOKEN_MAP, SINGLE_CHAR_TABLE
 from .token_type import TokenType as TT
 
+# Consumes a run of intra-line whitespace in one C-level call instead of
+# one scan_token iteration per character.
+_WS_RE = re.compile(rb'[ \t\r]+')
+
+# Lox identifiers and numbers are ASCII; hashed membership in these sets
+# of byte values is far cheaper than the Unicode-aware
+# str.isdigit/isalnum per char.
+_DIGITS = frozenset(b'0123456789')
+_IDENT_START = frozenset(
+    b'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_'
+)
+
+# Recognizes a whole identifier in one C-level match, anchored at the
+# token start (the dispatcher has already verified the first byte).
+_IDENT_RE = re.compile(rb'[A-Za-z_][A-Za-z0-9_]*')
+
+# Recognizes a whole number literal, integer or decimal, the same way.
+# [0-9] rather than \d keeps it ASCII-only like the rest of the scanner.
+_NUM_RE = re.compile(rb'[0-9]+(?:\.[0-9]+)?')
+
+
+class _B:
+    """Byte values the dispatcher cases on.
+
+    match/case needs dotted names here: a bare module-level name in a
+    case would be a capture pattern, not a comparison.
+    """
+
+    BANG = ord('!')
+    EQUAL = ord('=')
+    LESS = ord('<')
+    GREATER = ord('>')
+    SLASH = ord('/')
+    SPACE = ord(' ')
+    CR = ord('\r')
+    TAB = ord('\t')
+    NEWLINE = ord('\n')
+    QUOTE = ord('"')
+
 
 class Scanner:
+    __slots__ = (
+        'curr',
+        'ehand',
+        'line',
+        'n',
+        'ntok',
+        'source',
+        'start',
+        'tokens',
+    )
+
+    source: bytes
+    n: int
+    ehand: ErrorHandler
+    tokens: list[Token | None]
+    ntok: int
+    start: int
+    curr: int
+    line: int
+
     def __init__(self, source: str, error_handler: ErrorHandler) -> None:
-        self.source = source
+        # Scan raw bytes, not str: bytes[i] returns a small int with no
+        # allocation, where str[i] builds a fresh 1-char str per read.
+        # Lexemes decode back to str once per token, and UTF-8 keeps all
+        # ASCII delimiters at the same byte values.
+        # NUL sentinel: advance/match can index unconditionally and the
+        # scanning loops stop on it instead of re-checking a length.
+        self.source = source.encode() + b'\0'
+        self.n = len(self.source) - 1
         self.ehand = error_handler
-        self.tokens: list[Token] = []
+        # Preallocated at roughly one token per two source chars (an
+        # empirical upper bound) and written through an index pointer, so
+        # the list never pays an append-time resize on typical input.
+        self.tokens = [None] * max(16, self.n // 2)
+        self.ntok = 0
 
         self.start = 0
         self.curr = 0
         self.line = 1
 
     def scan_tokens(self) -> list[Token]:
-        while not self.is_at_end():
+        n = self.n
+        # Bound once: the loop then runs on LOAD_FASTs instead of paying
+        # an attribute lookup per token.
+        scan_token = self.scan_token
+        while self.curr < n:
             # At the beginning of the next lexeme
             self.start = self.curr
-            self.scan_token()
-
-        self.tokens.append(Token(TT.EOF, '', None, self.line))
-        return self.tokens
+            scan_token()
 
-    def is_at_end(self) -> bool:
-        return self.curr >= len(self.source)
+        self.add_token(TT.EOF, text='')
+        del self.tokens[self.ntok :]  # Drop the unused preallocated tail.
+        return cast(list[Token], self.tokens)
 
     def scan_token(self) -> None:
         c = self.advance()
 
-        if c in CHAR_TOKEN_MAP:
-            self.add_token(CHAR_TOKEN_MAP[c])
-            return
+        if c < 128:
+            token_type = SINGLE_CHAR_TABLE[c]
+            if token_type is not None:
+                # chr on an ASCII int is a cached 1-char str: no slice.
+                self.add_token(token_type, text=chr(c))
+                return
 
         # Individual cases
         match c:
-            case '!':
-                if self.match('='):
-                    self.add_token(TT.BANG_EQUAL)
+            case _B.BANG:
+                if self.match(_B.EQUAL):
+                    self.add_token(TT.BANG_EQUAL, text='!=')
                 else:
-                    self.add_token(TT.BANG)
+                    self.add_token(TT.BANG, text='!')
                 return
 
-            case '=':
-                if self.match('='):
-                    self.add_token(TT.EQUAL_EQUAL)
+            case _B.EQUAL:
+                if self.match(_B.EQUAL):
+                    self.add_token(TT.EQUAL_EQUAL, text='==')
                 else:
-                    self.add_token(TT.EQUAL)
+                    self.add_token(TT.EQUAL, text='=')
                 return
 
-            case '<':
-                if self.match('='):
-                    self.add_token(TT.LESS_EQUAL)
+            case _B.LESS:
+                if self.match(_B.EQUAL):
+                    self.add_token(TT.LESS_EQUAL, text='<=')
                 else:
-                    self.add_token(TT.LESS)
+                    self.add_token(TT.LESS, text='<')
                 return
 
-            case '>':
-                if self.match('='):
-                    self.add_token(TT.GREATER_EQUAL)
+            case _B.GREATER:
+                if self.match(_B.EQUAL):
+                    self.add_token(TT.GREATER_EQUAL, text='>=')
                 else:
-                    self.add_token(TT.GREATER)
+                    self.add_token(TT.GREATER, text='>')
                 return
 
-            case '/':
-                if self.match('/'):
-                    while self.peek() != '\n' and not self.is_at_end():
-                        self.advance()
+            case _B.SLASH:
+                if self.match(_B.SLASH):
+                    # One C-level scan to the end of the line (or file).
+                    nl = self.source.find(b'\n', self.curr)
+                    self.curr = nl if nl != -1 else self.n
                 else:
-                    self.add_token(TT.SLASH)
+                    self.add_token(TT.SLASH, text='/')
                 return
 
-            case ' ' | '\r' | '\t':
+            case _B.SPACE | _B.CR | _B.TAB:
+                # Skip the rest of the whitespace run in one step.
+                ws = _WS_RE.match(self.source, self.curr)
+                if ws:
+                    self.curr = ws.end()
                 return
 
-            case '\n':
+            case _B.NEWLINE:
                 self.line += 1
                 return
 
-            case '"':
+            case _B.QUOTE:
                 self.string()
                 return
 
-            case _ if c.isdigit():
+            case _ if c in _DIGITS:
                 self.number()
                 return
 
-            case _ if c.isalpha():
+            case _ if c in _IDENT_START:
                 self.identifier()
                 return
 
-        self.ehand.error(self.line, 'Unexpected char.')
+        self.ehand.error_at_line(self.line, 'Unexpected char.')
 
     def identifier(self) -> None:
-        while not self.is_at_end() and (
-            self.peek().isalnum() or self.peek() == '_'
-        ):
-            self.advance()
-
-        text = self.source[self.start : self.curr]
+        # One C-level match consumes the whole name; the dispatcher has
+        # already checked the first byte, so this cannot fail, and the
+        # sentinel is not an identifier byte so it bounds the match.
+        m = _IDENT_RE.match(self.source, self.start)
+        assert m is not None
+        self.curr = m.end()
+
+        # One decode per identifier; sys.intern then shares one copy of
+        # each name process-wide (the keyword-map keys are interned
+        # literals), so repeated identifiers alias a single str and
+        # hash/compare by pointer.
+        text = sys.intern(m.group().decode())
         token_type = KEYWORD_TOKEN_MAP.get(text)
         if token_type:
-            self.add_token(token_type)
+            self.add_token(token_type, text=text)
         else:
-            self.add_token(TT.IDENTIFIER)
+            self.add_token(TT.IDENTIFIER, text=text)
 
     def number(self) -> None:
-        while not self.is_at_end() and self.peek().isdigit():
-            self.advance()
+        # One C-level match covers digits, the optional decimal point and
+        # its lookahead; cannot fail since the dispatcher saw a digit.
+        m = _NUM_RE.match(self.source, self.start)
+        assert m is not None
+        self.curr = m.end()
 
-        # Decimal portion
-        if self.peek() == '.' and self.peek_next().isdigit():
-            self.advance()
-
-            while not self.is_at_end() and self.peek().isdigit():
-                self.advance()
-
-        self.add_token(TT.NUMBER, float(self.source[self.start : self.curr]))
+        text = m.group().decode()
+        self.add_token(TT.NUMBER, float(text), text=text)
 
     def string(self) -> None:
-        while not self.is_at_end() and self.peek() != '"':
-            if self.peek() == '\n':
-                self.line += 1
-            self.advance()
-
-        if self.is_at_end():
-            self.ehand.error(self.line, 'Unterminated string.')
+        # Find the closing quote and count the enclosed newlines with two
+        # C-level calls instead of a Python loop per character. Byte
+        # offsets of ASCII delimiters are valid UTF-8 boundaries, so the
+        # enclosed slice decodes cleanly even if the string itself holds
+        # non-ASCII text.
+        end = self.source.find(b'"', self.curr)
+        if end == -1:
+            self.line += self.source.count(b'\n', self.curr, self.n)
+            self.curr = self.n
+            self.ehand.error_at_line(self.line, 'Unterminated string.')
             return
 
-        self.advance()
-        self.add_token(TT.STRING, self.source[self.start + 1 : self.curr - 1])
-
-    def peek_next(self) -> str:
-        """Get next char without consuming."""
-        return (
-            '\0'
-            if (self.curr + 1 >= len(self.source))
-            else self.source[self.curr + 1]
-        )
-
-    def peek(self) -> str:
-        """Get current char without consuming."""
-        return '\0' if self.is_at_end() else self.source[self.curr]
+        self.line += self.source.count(b'\n', self.curr, end)
+        self.curr = end + 1
+        self.add_token(TT.STRING, self.source[self.start + 1 : end].decode())
 
-    def advance(self) -> str:
-        """Consumes next character in source and returns it."""
+    def advance(self) -> int:
+        """Consumes the next byte in source and returns it."""
         res = self.source[self.curr]
         self.curr += 1
         return res
 
-    def add_token(self, type: TT, literal: object = None) -> None:
+    def add_token(
+        self, type: TT, literal: object = None, text: str | None = None
+    ) -> None:
         """Adds the current token to the list of tokens"""
-        text = self.source[self.start : self.curr]
-        self.tokens.append(Token(type, text, literal, self.line))
+        if text is None:
+            text = self.source[self.start : self.curr].decode()
+        i = self.ntok
+        tokens = self.tokens
+        if i == len(tokens):
+            # Estimate exceeded (dense punctuation); grow normally.
+            tokens.append(Token(type, text, literal, self.line))
+        else:
+            tokens[i] = Token(type, text, literal, self.line)
+        self.ntok = i + 1
+
+    def match(self, expected_byte: int) -> bool:
+        """Check if we currently match expected_byte, and consume if we do.
 
-    def match(self, expected_char: str) -> bool:
-        """Check if we currently match expected_char, and consume if we do."""
-        if self.is_at_end() or self.source[self.curr] != expected_char:
+        The sentinel never equals a real expected byte, so no end check."""
+        if self.source[self.curr] != expected_byte:
             return False
         self.curr += 1
         return True
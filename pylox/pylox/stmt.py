@@ -1,22 +1,17 @@
 # pylox/stmt.py
 
- 
+
 from __future__ import annotations # For forward references
 
-from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Protocol, TypeVar
-              
+from typing import NamedTuple, Protocol, TypeVar
+
 from .lox_token import Token
-              
+
 T = TypeVar('T', covariant=True)
 
     
 from .expr import Expr
 
-class Stmt(ABC):
-    @abstractmethod
-    def accept(self, visitor: Visitor[T]) -> T: ...
 
 
 class Visitor(Protocol[T]):
@@ -25,26 +20,26 @@ class Visitor(Protocol[T]):
     def visit_var_stmt(self, stmt: Var) -> T: ...
 
 
-@dataclass(frozen=True)
-class Expression(Stmt):
+class Expression(NamedTuple):
     expression: Expr
 
     def accept(self, visitor: Visitor[T]) -> T:
         return visitor.visit_expression_stmt(self)
 
 
-@dataclass(frozen=True)
-class Print(Stmt):
+class Print(NamedTuple):
     expression: Expr
 
     def accept(self, visitor: Visitor[T]) -> T:
         return visitor.visit_print_stmt(self)
 
 
-@dataclass(frozen=True)
-class Var(Stmt):
+class Var(NamedTuple):
     name: Token
-    initializer: Expr
+    initializer: Expr | None
 
     def accept(self, visitor: Visitor[T]) -> T:
         return visitor.visit_var_stmt(self)
+
+
+Stmt = Expression | Print | Var
@@ -1,11 +1,15 @@
 # pylox/token_type.py
-from enum import StrEnum, auto, unique
+from enum import IntEnum, auto, unique
 from typing import Final  # Type-hint to indicate immutable
 
 
 @unique  # Ensure no two members have the same value
-class TokenType(StrEnum):
-    """A string enum which describes the types of tokens."""
+class TokenType(IntEnum):
+    """An integer enum which describes the types of tokens.
+
+    IntEnum members compare through C-level int equality, which the
+    parser's check/match helpers do once per token; StrEnum equality
+    went through str comparison."""
 
     # Single-character tokens.
     LEFT_PAREN = auto()
@@ -75,6 +79,15 @@ CHAR_TOKEN_MAP: Final[dict[str, TT]] = {
     '/': TT.SLASH,
 }
 
+# Flat 128-entry table indexed by ord(char): skips the dict hash and the
+# per-character str keys on the scanner's hottest dispatch. '/' is
+# deliberately absent — it needs one character of lookahead to tell
+# division from a '//' comment, so it stays with the two-char operators.
+SINGLE_CHAR_TABLE: Final[list[TT | None]] = [None] * 128
+for _char, _token_type in CHAR_TOKEN_MAP.items():
+    if _char != '/':
+        SINGLE_CHAR_TABLE[ord(_char)] = _token_type
+
 KEYWORD_TOKEN_MAP: Final[dict[str, TT]] = {
     'and': TT.AND,
     'class': TT.CLASS,
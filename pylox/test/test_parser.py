@@ -2,7 +2,7 @@
 
 
 from pylox.error_handler import ErrorHandler
-from pylox.expr import Binary, Grouping, Literal, Unary
+from pylox.expr import Binary, Chain, Grouping, Literal, Unary
 from pylox.lox_token import Token
 from pylox.parser import Parser
 from pylox.token_type import TokenType as TT
@@ -14,9 +14,12 @@ def make_token(token_type, lexeme=None, literal=None, line=1):
 
 def parse_expr(tokens):
     eh = ErrorHandler()
-    tokens = tokens + [make_token(TT.EOF)]  # Always add EOF
+    # Wrap the expression as an expression statement: ... ";" EOF
+    tokens = tokens + [make_token(TT.SEMICOLON, ';'), make_token(TT.EOF)]
     parser = Parser(tokens, eh)
-    return parser.parse()
+    statements = parser.parse()
+    assert statements is not None and len(statements) == 1
+    return statements[0].expression
 
 
 def test_literal_number():
@@ -55,6 +58,47 @@ def test_binary_addition():
     assert expr.operator.token_type == TT.PLUS
 
 
+def test_chain_addition():
+    # A run of three or more operands at one precedence flattens into a
+    # single Chain node, in source order.
+    expr = parse_expr(
+        [
+            make_token(TT.NUMBER, '1', 1),
+            make_token(TT.PLUS),
+            make_token(TT.NUMBER, '2', 2),
+            make_token(TT.PLUS),
+            make_token(TT.NUMBER, '3', 3),
+        ]
+    )
+    assert isinstance(expr, Chain)
+    assert [operand.value for operand in expr.operands] == [1, 2, 3]
+    assert [op.token_type for op in expr.operators] == [TT.PLUS, TT.PLUS]
+
+
+def test_chain_with_precedence():
+    # 1 + 2 + 3 * 4: the PLUS run flattens to a Chain whose last operand
+    # is the tighter product, and the single STAR stays a plain Binary.
+    expr = parse_expr(
+        [
+            make_token(TT.NUMBER, '1', 1),
+            make_token(TT.PLUS),
+            make_token(TT.NUMBER, '2', 2),
+            make_token(TT.PLUS),
+            make_token(TT.NUMBER, '3', 3),
+            make_token(TT.STAR),
+            make_token(TT.NUMBER, '4', 4),
+        ]
+    )
+    assert isinstance(expr, Chain)
+    assert len(expr.operands) == 3
+    assert [op.token_type for op in expr.operators] == [TT.PLUS, TT.PLUS]
+    product = expr.operands[2]
+    assert isinstance(product, Binary)
+    assert product.operator.token_type == TT.STAR
+    assert product.left.value == 3
+    assert product.right.value == 4
+
+
 def test_grouping():
     expr = parse_expr(
         [
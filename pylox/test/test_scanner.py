@@ -52,6 +52,28 @@ def test_grouped_expression() -> None:
     assert actual_types == expected_types
 
 
+def test_identifier_with_digits() -> None:
+    # Must scan as one identifier, not an identifier then a number.
+    tokens = scan('foo1')
+    assert len(tokens) == 2
+    assert tokens[0].token_type == TT.IDENTIFIER
+    assert tokens[0].lexeme == 'foo1'
+
+
+def test_line_comment_is_skipped() -> None:
+    handler = ErrorHandler()
+    scanner = Scanner('// nothing to see\nprint', handler)
+    tokens = scanner.scan_tokens()
+    assert [t.token_type for t in tokens] == [TT.PRINT, TT.EOF]
+    assert handler.has_error is False
+
+
+def test_slash_is_division() -> None:
+    tokens = scan('1 / 2')
+    expected_types = [TT.NUMBER, TT.SLASH, TT.NUMBER, TT.EOF]
+    assert [t.token_type for t in tokens] == expected_types
+
+
 def test_unexpected_char() -> None:
     handler = ErrorHandler()
     scanner = Scanner('@', handler)